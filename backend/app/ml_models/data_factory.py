@@ -7,7 +7,7 @@ import pandas as pd
 import numpy as np
 import random
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # Crop Profiles (Ideal conditions)
 # Used as centroids for data generation
@@ -39,54 +39,72 @@ CROP_PROFILES = {
 # 1=Sandy, 2=Loam, 3=Clay
 SOIL_MAP = {1: 'sandy', 2: 'loam', 3: 'clay'}
 
+# CROP_PROFILES laid out as per-crop arrays (index = crop id), built once at import
+CROP_NAMES = np.array(list(CROP_PROFILES.keys()))
+_PROFILE_RANGES = {
+    key: np.array([CROP_PROFILES[crop][key] for crop in CROP_NAMES], dtype=np.float64)
+    for key in ("N", "P", "K", "temp", "humidity", "ph", "rainfall")
+}
+CROP_CENTROIDS = {key: ranges.mean(axis=1) for key, ranges in _PROFILE_RANGES.items()}
+CROP_SPREADS = {key: (ranges[:, 1] - ranges[:, 0]) / 4 for key, ranges in _PROFILE_RANGES.items()}
+CROP_SOIL_CODES = np.array([CROP_PROFILES[crop]["soil"] for crop in CROP_NAMES], dtype=np.int64)
+
 print("🌱 Initializing DataFactory for Crop Model...")
 
 class DataFactory:
     """Generates synthetic agricultural data based on expert rulesets"""
     
     @staticmethod
-    def generate_dataset(num_samples: int = 10000) -> pd.DataFrame:
-        data = []
-        crops = list(CROP_PROFILES.keys())
+    def generate_dataset(num_samples: int = 10000, seed: Optional[int] = None) -> pd.DataFrame:
+        # One PCG64 generator for every draw; pass a seed for reproducible datasets
+        rng = np.random.default_rng(seed)
+        n_crops = len(CROP_NAMES)
         
         # Calculate samples per crop
-        samples_per_crop = num_samples // len(crops)
+        samples_per_crop = num_samples // n_crops
+        n = samples_per_crop * n_crops
+        
+        # Each row's crop index; per-crop centroids are gathered through it so
+        # every column is drawn in a single vectorized call
+        crop_idx = np.repeat(np.arange(n_crops), samples_per_crop)
+        
+        def centroid(key: str) -> np.ndarray:
+            return CROP_CENTROIDS[key][crop_idx]
+        
+        def spread(key: str) -> np.ndarray:
+            return CROP_SPREADS[key][crop_idx]
+        
+        # Add Gaussian noise to create realistic variance
+        # N, P, K, pH, temp, hum, rain
+        soil_type_code = CROP_SOIL_CODES[crop_idx]  # Centroid soil type (fancy indexing copies)
+        
+        # Introduce some "wrong soil" samples to help model learn robustness (5% chance)
+        wrong_soil = rng.random(n) < 0.05
+        soil_type_code[wrong_soil] = rng.integers(1, 4, size=int(wrong_soil.sum()))
+        
+        # Columns are built with their final dtypes (small ints, categorical label)
+        # so pandas does not have to infer or widen anything
+        df = pd.DataFrame({
+            "N": np.maximum(0, np.trunc(rng.normal(centroid("N"), spread("N")))).astype(np.int16),
+            "P": np.maximum(0, np.trunc(rng.normal(centroid("P"), spread("P")))).astype(np.int16),
+            "K": np.maximum(0, np.trunc(rng.normal(centroid("K"), spread("K")))).astype(np.int16),
+            "temperature": rng.normal(centroid("temp"), 2.0),
+            "humidity": np.clip(rng.normal(centroid("humidity"), 5.0), 0, 100),
+            "ph": np.clip(rng.normal(centroid("ph"), 0.3), 3.0, 9.0),
+            "rainfall": np.maximum(0, rng.normal(centroid("rainfall"), 15.0)),
+            "soil_type_code": soil_type_code.astype(np.int8),
+            # Add altitude and solar rad as extras for improved model (not strictly in std datasets but good for advanced)
+            "altitude": rng.integers(100, 800, size=n).astype(np.int16), # Meters
+            "solar_rad": rng.normal(18, 3, size=n), # MJ/m2
+            "market_price": rng.uniform(50, 250, size=n), # Randomized market price per unit
+            "label": pd.Categorical.from_codes(crop_idx, categories=CROP_NAMES),
+        })
         
-        for crop in crops:
-            profile = CROP_PROFILES[crop]
-            
-            for _ in range(samples_per_crop):
-                # Add Gaussian noise to create realistic variance
-                # N, P, K, pH, temp, hum, rain
-                row = {
-                    "N": max(0, int(np.random.normal(np.mean(profile["N"]), (profile["N"][1]-profile["N"][0])/4))),
-                    "P": max(0, int(np.random.normal(np.mean(profile["P"]), (profile["P"][1]-profile["P"][0])/4))),
-                    "K": max(0, int(np.random.normal(np.mean(profile["K"]), (profile["K"][1]-profile["K"][0])/4))),
-                    "temperature": np.random.normal(np.mean(profile["temp"]), 2.0),
-                    "humidity": min(100, max(0, np.random.normal(np.mean(profile["humidity"]), 5.0))),
-                    "ph": min(9.0, max(3.0, np.random.normal(np.mean(profile["ph"]), 0.3))),
-                    "rainfall": max(0, np.random.normal(np.mean(profile["rainfall"]), 15.0)),
-                    "soil_type_code": profile["soil"],  # Centroid soil type
-                    # Add altitude and solar rad as extras for improved model (not strictly in std datasets but good for advanced)
-                    "altitude": np.random.randint(100, 800), # Meters
-                    "solar_rad": np.random.normal(18, 3), # MJ/m2
-                    "market_price": np.random.uniform(50, 250), # Randomized market price per unit
-                    "label": crop
-                }
-                
-                # Introduce some "wrong soil" samples to help model learn robustness (5% chance)
-                if random.random() < 0.05:
-                     row["soil_type_code"] = random.choice([1, 2, 3])
-                     
-                data.append(row)
-                
         # Remainder
-        while len(data) < num_samples:
-             choice = random.choice(crops)
-             # ... copy logic ... simplified just taking from array
-             data.append(data[0].copy()) # dummy
-             
-        df = pd.DataFrame(data)
+        remainder = num_samples - n
+        if remainder > 0 and n > 0:
+            # ... copy logic ... simplified just taking from array
+            df = pd.concat([df, df.iloc[[0] * remainder]], ignore_index=True) # dummy
         
         # Final cleanup
         df['N'] = df['N'].clip(0, 140)
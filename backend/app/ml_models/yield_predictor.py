@@ -5,7 +5,9 @@ Uses Random Forest Regressor for yield prediction
 """
 
 import os
+import json
 import pickle
+import hashlib
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -65,6 +67,9 @@ class YieldPredictor:
         self.feature_importances = None
         self.is_trained = False
         self.model_path = os.path.join(os.path.dirname(__file__), 'yield_model.pkl')
+        # Small JSON summary written next to the pickle, so tools can inspect
+        # the model without unpickling it
+        self.manifest_path = os.path.splitext(self.model_path)[0] + '.json'
         
         # Try to load pre-trained model
         self._load_model()
@@ -101,6 +106,20 @@ class YieldPredictor:
             print(f"✓ Saved yield model to {self.model_path}")
         except Exception as e:
             print(f"⚠️ Could not save model: {e}")
+            return
+        
+        try:
+            with open(self.model_path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            with open(self.manifest_path, 'w') as f:
+                json.dump({
+                    'model_type': type(self.model).__name__,
+                    'n_features': len(self.feature_columns),
+                    'feature_columns': list(self.feature_columns),
+                    'sha256': digest,
+                }, f, indent=2)
+        except Exception as e:
+            print(f"⚠️ Could not write model manifest: {e}")
     
     def train(self, csv_path: str) -> Dict:
         """Train the yield prediction model on the dataset"""
@@ -1,4 +1,6 @@
 import json
+import inspect
+from typing import List
 import torch
 from PIL import Image
 from torchvision import transforms
@@ -20,11 +22,36 @@ CONFIDENCE_THRESHOLDS = {
 
 device = torch.device("cpu")
 
+# Optional intra-op thread count for the CPU kernels, e.g. the container's CPU
+# quota divided between uvicorn workers; unset keeps torch's own default
+if "DISEASE_MODEL_THREADS" in os.environ:
+    torch.set_num_threads(max(1, int(os.environ["DISEASE_MODEL_THREADS"])))
+
+# Most images classified in one forward pass (and accepted per batch request)
+MAX_BATCH_SIZE = max(1, int(os.environ.get("DISEASE_MODEL_MAX_BATCH", "16")))
+
+# Opt-in TorchInductor compilation; each worker pays the compile time on its first prediction
+COMPILE_MODEL = os.environ.get("DISEASE_MODEL_COMPILE", "0") == "1"
+
 # ---------------- LOAD MODEL ----------------
 
-model = get_model()
-model.load_state_dict(torch.load(MODEL_PATH, map_location=device))
+# Memory-map the checkpoint and load tensors only (no arbitrary pickled objects)
+# where this torch version supports it
+if "mmap" in inspect.signature(torch.load).parameters:
+    state_dict = torch.load(MODEL_PATH, map_location=device, weights_only=True, mmap=True)
+else:
+    state_dict = torch.load(MODEL_PATH, map_location=device)
+
+# ImageNet weights would be overwritten by the checkpoint, so skip loading them
+model = get_model(pretrained=False)
+model.load_state_dict(state_dict)
+del state_dict
 model.eval()
+# NHWC layout lets the CPU (oneDNN) convolution kernels run without reordering
+model = model.to(memory_format=torch.channels_last)
+
+if COMPILE_MODEL and hasattr(torch, "compile"):
+    model = torch.compile(model)
 
 # ---------------- LOAD CLASS NAMES ----------------
 
@@ -33,6 +60,16 @@ with open(CLASS_NAMES_PATH, "r") as f:
 
 idx_to_class = {i: name for i, name in enumerate(class_names)}
 
+# Class indices for each crop ("Tomato___Early_blight" -> "Tomato"), built once
+# as index tensors so predictions can gather just that crop's columns
+crop_to_indices = {}
+for i, name in idx_to_class.items():
+    crop_to_indices.setdefault(name.split("___")[0], []).append(i)
+crop_to_indices = {
+    crop: torch.tensor(indices, dtype=torch.long)
+    for crop, indices in crop_to_indices.items()
+}
+
 # ---------------- TRANSFORMS ----------------
 
 transform = transforms.Compose([
@@ -46,37 +83,8 @@ transform = transforms.Compose([
 
 # ---------------- INFERENCE FUNCTION ----------------
 
-def predict(image_path: str, crop: str) -> dict:
-    image = Image.open(image_path).convert("RGB")
-    image = transform(image).unsqueeze(0)
-
-    with torch.no_grad():
-        outputs = model(image)
-        probs = torch.softmax(outputs, dim=1)
-
-    # Crop-based filtering
-    valid_indices = [
-        i for i, name in idx_to_class.items()
-        if name.startswith(crop + "___")
-    ]
-
-    if not valid_indices:
-        return {
-            "crop": crop,
-            "disease": None,
-            "confidence": 0.0,
-            "status": "unsupported_crop"
-        }
-
-    mask = torch.zeros_like(probs)
-    mask[:, valid_indices] = 1
-    filtered_probs = probs * mask
-
-    conf, pred = torch.max(filtered_probs, dim=1)
-
-    class_name = idx_to_class[pred.item()]
-    _, disease = class_name.split("___")
-    confidence = conf.item() * 100
+def _build_result(crop: str, class_index: int, confidence: float) -> dict:
+    _, disease = idx_to_class[class_index].split("___")
 
     threshold = CONFIDENCE_THRESHOLDS.get(crop, 30.0)
 
@@ -97,3 +105,51 @@ def predict(image_path: str, crop: str) -> dict:
         "confidence_label": confidence_label,
         "status": status
     }
+
+
+def predict_batch(image_paths: List[str], crop: str) -> List[dict]:
+    """Classify several images of the same crop, MAX_BATCH_SIZE per forward pass."""
+    # Crop-based filtering
+    valid_indices = crop_to_indices.get(crop)
+
+    if valid_indices is None:
+        return [
+            {
+                "crop": crop,
+                "disease": None,
+                "confidence": 0.0,
+                "status": "unsupported_crop"
+            }
+            for _ in image_paths
+        ]
+
+    results = []
+
+    # Decode and run at most MAX_BATCH_SIZE images at a time to bound memory
+    for start in range(0, len(image_paths), MAX_BATCH_SIZE):
+        images = torch.stack([
+            transform(Image.open(path).convert("RGB"))
+            for path in image_paths[start:start + MAX_BATCH_SIZE]
+        ]).contiguous(memory_format=torch.channels_last)
+
+        with torch.inference_mode():
+            outputs = model(images)
+
+            # Softmax is monotonic, so the best of this crop's classes comes straight
+            # from the logits; only the winners' probabilities (still over all classes)
+            # are computed, for the reported confidence
+            best_logits, local = torch.max(outputs.index_select(1, valid_indices), dim=1)
+            conf = torch.exp(best_logits - torch.logsumexp(outputs, dim=1))
+
+        preds = valid_indices[local]
+
+        results.extend(
+            _build_result(crop, pred, confidence * 100)
+            for pred, confidence in zip(preds.tolist(), conf.tolist())
+        )
+
+    return results
+
+
+def predict(image_path: str, crop: str) -> dict:
+    return predict_batch([image_path], crop)[0]
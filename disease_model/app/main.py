@@ -3,8 +3,9 @@ from fastapi.responses import JSONResponse
 from PIL import Image
 import tempfile
 import os
+from typing import List
 
-from .inference import predict
+from .inference import predict, predict_batch, MAX_BATCH_SIZE
 
 app = FastAPI(title="Plant Disease Detection Service")
 
@@ -27,3 +28,34 @@ async def predict_disease(
         return JSONResponse(content=result)
     finally:
         os.remove(temp_path)
+
+
+@app.post("/predict/batch")
+async def predict_disease_batch(
+    crop: str = Form(...),
+    images: List[UploadFile] = File(...)
+):
+    if len(images) > MAX_BATCH_SIZE:
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"At most {MAX_BATCH_SIZE} images per batch request"}
+        )
+
+    # Save all uploads first so they are classified in as few forward passes as possible
+    temp_paths = []
+    try:
+        for image in images:
+            suffix = os.path.splitext(image.filename)[-1]
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+                # Track the file before writing so a failed write is still cleaned up
+                temp_paths.append(tmp.name)
+                tmp.write(await image.read())
+
+        results = predict_batch(
+            image_paths=temp_paths,
+            crop=crop
+        )
+        return JSONResponse(content={"results": results})
+    finally:
+        for temp_path in temp_paths:
+            os.remove(temp_path)
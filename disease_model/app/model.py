@@ -4,8 +4,9 @@ from torchvision import models
 
 NUM_CLASSES = 38
 
-def get_model():
-    model = models.resnet50(weights=models.ResNet50_Weights.IMAGENET1K_V1)
+def get_model(pretrained: bool = True):
+    weights = models.ResNet50_Weights.IMAGENET1K_V1 if pretrained else None
+    model = models.resnet50(weights=weights)
 
     for param in model.parameters():
         param.requires_grad = False
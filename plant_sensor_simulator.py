@@ -17,18 +17,41 @@ Sensors Simulated:
 Usage:
     python plant_sensor_simulator.py
 
+Environment:
+    API_BASE_URL     Backend URL (default http://localhost:5000)
+    FARM_ID          Farm to send readings for (prompted if unset)
+    UPDATE_INTERVAL  Seconds between readings (default 5)
+    BATCH_SIZE       Readings to buffer before each POST (default 1, max 200)
+    SIMULATOR_SEED   Seed for reproducible readings (default random)
+    DISPLAY_EVERY    Redraw the dashboard every N readings (default 1)
+    SIM_QUIET        Set to 1 to skip the dashboard and print status lines
+    SIM_LOG_EVERY    In quiet mode, print a status line every N readings (default 10)
+
 Author: Smart-Farming Sensor Module
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
-import random
 import math
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
 import sys
+import queue
+import shutil
+import threading
+import unicodedata
+
+import numpy as np
+
+# Optional fast JSON encoder for API payloads
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # ============================================================================
 # CONFIGURATION
@@ -44,6 +67,27 @@ DEFAULT_FARM_ID = os.environ.get("FARM_ID", "")
 # Sensor update interval in seconds
 UPDATE_INTERVAL = int(os.environ.get("UPDATE_INTERVAL", "5"))
 
+# Most readings sent in one POST: the API's default 100 KB JSON body limit
+# fits roughly 400 readings, so stay well under it
+MAX_BATCH_READINGS = 200
+
+# Number of readings to buffer before POSTing them together (1 = send each reading)
+BATCH_SIZE = min(MAX_BATCH_READINGS, max(1, int(os.environ.get("BATCH_SIZE", "1"))))
+
+# Optional seed for reproducible sensor runs (empty = random every run)
+SIMULATOR_SEED = os.environ.get("SIMULATOR_SEED", "")
+
+# Redraw the console dashboard every N readings (1 = every reading)
+DISPLAY_EVERY = max(1, int(os.environ.get("DISPLAY_EVERY", "1")))
+
+# Quiet mode: skip the dashboard and print a one-line status every SIM_LOG_EVERY readings
+QUIET = os.environ.get("SIM_QUIET", "0") == "1"
+LOG_EVERY = max(1, int(os.environ.get("SIM_LOG_EVERY", "10")))
+
+# Time-of-day factor for each hour (sine wave peaking at noon), precomputed
+# so the simulation never evaluates math.sin on the hot path
+HOUR_TIME_FACTOR = tuple((math.sin(math.pi * (hour - 6) / 12) + 1) / 2 for hour in range(24))
+
 # ============================================================================
 # REALISTIC SENSOR VALUE RANGES
 # ============================================================================
@@ -89,6 +133,56 @@ class SensorRanges:
     EC_MAX = 2.5
     EC_OPTIMAL = (0.8, 1.8)
 
+# ============================================================================
+# VECTORIZED SENSOR STATE
+# ============================================================================
+
+# Every sensor channel lives at a fixed index of one NumPy state vector
+SENSOR_KEYS = (
+    "soil_moisture", "temperature", "humidity",
+    "nitrogen", "phosphorus", "potassium",
+    "ph", "ec", "battery_level", "signal_strength"
+)
+(MOISTURE, TEMPERATURE, HUMIDITY,
+ NITROGEN, PHOSPHORUS, POTASSIUM,
+ PH, EC, BATTERY, SIGNAL) = range(len(SENSOR_KEYS))
+NPK = slice(NITROGEN, POTASSIUM + 1)
+
+# State is kept in float32: readings are reported to at most two decimals,
+# so double precision only doubles the bytes touched per tick
+STATE_DTYPE = np.float32
+
+# Starting values (optimal mid-range)
+INITIAL_STATE = np.array([55.0, 25.0, 65.0, 145.0, 38.0, 85.0, 6.8, 1.2, 100.0, -50.0], dtype=STATE_DTYPE)
+
+# Hard bounds per channel (signal strength is re-based every tick instead)
+CHANNEL_MIN = np.array([
+    SensorRanges.SOIL_MOISTURE_MIN, SensorRanges.TEMP_MIN, SensorRanges.HUMIDITY_MIN,
+    SensorRanges.NITROGEN_MIN, SensorRanges.PHOSPHORUS_MIN, SensorRanges.POTASSIUM_MIN,
+    SensorRanges.PH_MIN, SensorRanges.EC_MIN, 0.0, -np.inf
+], dtype=STATE_DTYPE)
+CHANNEL_MAX = np.array([
+    SensorRanges.SOIL_MOISTURE_MAX, SensorRanges.TEMP_MAX, SensorRanges.HUMIDITY_MAX,
+    SensorRanges.NITROGEN_MAX, SensorRanges.PHOSPHORUS_MAX, SensorRanges.POTASSIUM_MAX,
+    SensorRanges.PH_MAX, SensorRanges.EC_MAX, 100.0, np.inf
+], dtype=STATE_DTYPE)
+
+# Per-tick random fluctuation (evaporation, plant uptake and battery drain are negative)
+NOISE_LOW = np.array([-0.5, -0.5, -1.0, -0.5, -0.5, -0.5, -0.05, -0.05, -0.05, -5.0], dtype=STATE_DTYPE)
+NOISE_HIGH = np.array([-0.1, 0.5, 1.0, -0.1, -0.1, -0.1, 0.05, 0.05, -0.01, 5.0], dtype=STATE_DTYPE)
+
+# Chance per tick of a discrete event and its size:
+# watering (moisture), fertilization (NPK), solar charging (battery), interference (signal)
+EVENT_PROBABILITY = np.array([0.05, 0.0, 0.0, 0.03, 0.03, 0.03, 0.0, 0.0, 0.01, 0.05], dtype=STATE_DTYPE)
+EVENT_LOW = np.array([5.0, 0.0, 0.0, 5.0, 5.0, 5.0, 0.0, 0.0, 2.0, -20.0], dtype=STATE_DTYPE)
+EVENT_HIGH = np.array([15.0, 0.0, 0.0, 20.0, 20.0, 20.0, 0.0, 0.0, 5.0, -10.0], dtype=STATE_DTYPE)
+
+# How much each channel's trend feeds into its change, and how far the trend may wander
+TREND_GAIN = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.1, 0.0, 0.0, 0.0], dtype=STATE_DTYPE)
+TREND_LIMIT = np.array([0.5, 0.3, 0.5, 0.2, 0.2, 0.2, 0.1, 0.0, 0.0, 0.0], dtype=STATE_DTYPE)
+
+SIGNAL_BASE = -55.0
+
 # ============================================================================
 # SENSOR SIMULATOR CLASS
 # ============================================================================
@@ -100,253 +194,118 @@ class PlantSensorSimulator:
     - Gradual changes (not jumping values)
     - Random environmental fluctuations
     - Correlated values (e.g., higher temp → lower humidity)
+    
+    All channels are held in one NumPy state vector (see SENSOR_KEYS) and
+    advanced together by tick(), so a reading costs a handful of vectorized
+    operations instead of dozens of scalar Python calls.
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.ranges = SensorRanges()
         
+        # One PCG64 generator per simulator: seeded from OS entropy by default,
+        # or from `seed` for reproducible runs
+        self.rng = np.random.default_rng(seed)
+        
         # Initialize sensor values to optimal mid-range
-        self.current_values = {
-            "soil_moisture": 55.0,
-            "temperature": 25.0,
-            "humidity": 65.0,
-            "nitrogen": 145.0,
-            "phosphorus": 38.0,
-            "potassium": 85.0,
-            "ph": 6.8,
-            "ec": 1.2,
-            "battery_level": 100.0,
-            "signal_strength": -50.0
-        }
+        self.state = INITIAL_STATE.copy()
         
         # Track trends for realistic value progression
-        self.trends = {key: random.uniform(-0.5, 0.5) for key in self.current_values}
+        self.trends = self.rng.uniform(-0.5, 0.5, len(SENSOR_KEYS)).astype(STATE_DTYPE)
         
         # Simulation state
         self.readings_count = 0
         self.start_time = datetime.now()
+    
+    @property
+    def current_values(self) -> Dict[str, float]:
+        """Dict view of the current (unrounded) sensor values"""
+        return dict(zip(SENSOR_KEYS, self.state.tolist()))
         
-    def get_time_factor(self) -> float:
+    def get_time_factor(self, now: Optional[datetime] = None) -> float:
         """
         Returns a factor based on time of day (0.0 to 1.0)
         - 0.0 = midnight (coolest)
         - 0.5 = 6 AM / 6 PM
         - 1.0 = noon (hottest)
         """
-        hour = datetime.now().hour
-        # Create a sine wave that peaks at noon
-        return (math.sin(math.pi * (hour - 6) / 12) + 1) / 2
-    
-    def update_trend(self, key: str, min_trend: float = -0.5, max_trend: float = 0.5) -> None:
-        """Gradually update value trends to simulate environmental changes"""
-        change = random.uniform(-0.2, 0.2)
-        self.trends[key] = max(min_trend, min(max_trend, self.trends[key] + change))
-    
-    def bounded_update(self, current: float, change: float, min_val: float, max_val: float) -> float:
-        """Update a value while keeping it within bounds"""
-        new_value = current + change
-        return max(min_val, min(max_val, new_value))
-    
-    def simulate_soil_moisture(self) -> float:
-        """
-        Simulate soil moisture:
-        - Decreases over time (evaporation)
-        - Can increase (simulating irrigation or rain)
-        - Affected by temperature (higher temp = faster evaporation)
-        """
-        temp_factor = (self.current_values["temperature"] - 20) / 30  # Higher temp = more evaporation
-        evaporation = random.uniform(0.1, 0.5) * (1 + temp_factor)
-        
-        # Occasional "watering" event (5% chance)
-        if random.random() < 0.05:
-            watering = random.uniform(5, 15)
-            change = watering - evaporation
-        else:
-            change = -evaporation + self.trends["soil_moisture"]
-        
-        self.update_trend("soil_moisture")
-        self.current_values["soil_moisture"] = self.bounded_update(
-            self.current_values["soil_moisture"],
-            change,
-            self.ranges.SOIL_MOISTURE_MIN,
-            self.ranges.SOIL_MOISTURE_MAX
-        )
-        return round(self.current_values["soil_moisture"], 1)
+        return HOUR_TIME_FACTOR[(now or datetime.now()).hour]
     
-    def simulate_temperature(self) -> float:
+    def tick(self, now: Optional[datetime] = None) -> np.ndarray:
         """
-        Simulate temperature:
-        - Follows time-of-day pattern (warmer midday, cooler night)
-        - Random fluctuations for cloud cover, wind, etc.
+        Advance every sensor channel by one reading:
+        - Soil moisture evaporates faster when hot, with occasional watering
+        - Temperature follows the time-of-day pattern
+        - Humidity is inversely related to temperature
+        - NPK slowly depletes, with occasional fertilization
+        - pH drifts slightly, EC follows the nutrient level
+        - Battery drains with occasional solar charging, signal fluctuates with drops
         """
-        time_factor = self.get_time_factor()
-        
-        # Target temperature based on time of day
-        target_temp = self.ranges.TEMP_MIN + (self.ranges.TEMP_MAX - self.ranges.TEMP_MIN) * time_factor
-        
-        # Gradually move toward target with some randomness
-        diff = target_temp - self.current_values["temperature"]
-        change = diff * 0.1 + random.uniform(-0.5, 0.5) + self.trends["temperature"]
+        state = self.state
+        rng = self.rng
+        n = len(SENSOR_KEYS)
         
-        self.update_trend("temperature", -0.3, 0.3)
-        self.current_values["temperature"] = self.bounded_update(
-            self.current_values["temperature"],
-            change,
-            self.ranges.TEMP_MIN,
-            self.ranges.TEMP_MAX
-        )
-        return round(self.current_values["temperature"], 1)
-    
-    def simulate_humidity(self) -> float:
-        """
-        Simulate humidity:
-        - Inversely related to temperature
-        - Higher at night, lower during hot midday
-        """
-        temp = self.current_values["temperature"]
+        # All randomness for this tick in a single draw, scaled per channel
+        u = rng.random((4, n), dtype=STATE_DTYPE)
+        noise = NOISE_LOW + u[0] * (NOISE_HIGH - NOISE_LOW)
+        events = u[1] < EVENT_PROBABILITY
+        bursts = EVENT_LOW + u[2] * (EVENT_HIGH - EVENT_LOW)
+        trend_step = u[3] * 0.4 - 0.2
         
-        # Inverse relationship with temperature
-        temp_factor = (self.ranges.TEMP_MAX - temp) / (self.ranges.TEMP_MAX - self.ranges.TEMP_MIN)
-        target_humidity = self.ranges.HUMIDITY_MIN + (self.ranges.HUMIDITY_MAX - self.ranges.HUMIDITY_MIN) * temp_factor
+        # Scalar channels read by several formulas below, indexed once
+        current_temp = state[TEMPERATURE]
         
-        diff = target_humidity - self.current_values["humidity"]
-        change = diff * 0.05 + random.uniform(-1.0, 1.0) + self.trends["humidity"]
+        # Higher temp = more evaporation
+        noise[MOISTURE] *= 1 + (current_temp - 20) / 30
         
-        self.update_trend("humidity", -0.5, 0.5)
-        self.current_values["humidity"] = self.bounded_update(
-            self.current_values["humidity"],
-            change,
-            self.ranges.HUMIDITY_MIN,
-            self.ranges.HUMIDITY_MAX
-        )
-        return round(self.current_values["humidity"], 1)
-    
-    def simulate_npk(self) -> Dict[str, float]:
-        """
-        Simulate NPK levels:
-        - Slowly decrease over time (plant uptake)
-        - Occasional increases (fertilization events)
-        """
-        npk = {}
+        # Events replace the trend for that tick; otherwise the trend carries on
+        change = np.where(events, bursts + noise, noise + self.trends * TREND_GAIN)
         
-        for nutrient, (min_val, max_val) in [
-            ("nitrogen", (self.ranges.NITROGEN_MIN, self.ranges.NITROGEN_MAX)),
-            ("phosphorus", (self.ranges.PHOSPHORUS_MIN, self.ranges.PHOSPHORUS_MAX)),
-            ("potassium", (self.ranges.POTASSIUM_MIN, self.ranges.POTASSIUM_MAX))
-        ]:
-            # Slow depletion with occasional fertilization
-            depletion = random.uniform(0.1, 0.5)
-            
-            # 3% chance of fertilization event
-            if random.random() < 0.03:
-                fertilization = random.uniform(5, 20)
-                change = fertilization - depletion
-            else:
-                change = -depletion + self.trends[nutrient]
-            
-            self.update_trend(nutrient, -0.2, 0.2)
-            self.current_values[nutrient] = self.bounded_update(
-                self.current_values[nutrient],
-                change,
-                min_val,
-                max_val
-            )
-            npk[nutrient] = round(self.current_values[nutrient], 1)
+        # Temperature gradually moves toward the time-of-day target
+        r = self.ranges
+        target_temp = r.TEMP_MIN + (r.TEMP_MAX - r.TEMP_MIN) * self.get_time_factor(now)
+        change[TEMPERATURE] += (target_temp - current_temp) * 0.1
         
-        return npk
-    
-    def simulate_ph(self) -> float:
-        """
-        Simulate pH:
-        - Relatively stable but with small fluctuations
-        - Can be affected by irrigation water, fertilizers
-        """
-        change = random.uniform(-0.05, 0.05) + self.trends["ph"] * 0.1
+        # Humidity and EC follow this tick's temperature and nutrient levels
+        temp = min(r.TEMP_MAX, max(r.TEMP_MIN, current_temp + change[TEMPERATURE]))
+        avg_npk = np.clip(state[NPK] + change[NPK], CHANNEL_MIN[NPK], CHANNEL_MAX[NPK]).mean()
         
-        self.update_trend("ph", -0.1, 0.1)
-        self.current_values["ph"] = self.bounded_update(
-            self.current_values["ph"],
-            change,
-            self.ranges.PH_MIN,
-            self.ranges.PH_MAX
-        )
-        return round(self.current_values["ph"], 2)
-    
-    def simulate_ec(self) -> float:
-        """
-        Simulate Electrical Conductivity:
-        - Related to soil salinity and nutrient concentration
-        - Increases with fertilization, decreases with irrigation
-        """
-        # EC correlates with nutrient levels
-        avg_npk = (self.current_values["nitrogen"] + 
-                   self.current_values["phosphorus"] + 
-                   self.current_values["potassium"]) / 3
+        temp_factor = (r.TEMP_MAX - temp) / (r.TEMP_MAX - r.TEMP_MIN)
+        target_humidity = r.HUMIDITY_MIN + (r.HUMIDITY_MAX - r.HUMIDITY_MIN) * temp_factor
+        change[HUMIDITY] += (target_humidity - state[HUMIDITY]) * 0.05
         
         target_ec = 0.5 + (avg_npk / 150) * 1.5  # Scale based on nutrients
-        diff = target_ec - self.current_values["ec"]
-        change = diff * 0.1 + random.uniform(-0.05, 0.05)
+        change[EC] += (target_ec - state[EC]) * 0.1
         
-        self.current_values["ec"] = self.bounded_update(
-            self.current_values["ec"],
-            change,
-            self.ranges.EC_MIN,
-            self.ranges.EC_MAX
-        )
-        return round(self.current_values["ec"], 2)
-
-    def simulate_battery(self) -> float:
-        """
-        Simulate Battery Level:
-        - Slow drain over time
-        - Occasional charging event (solar)
-        """
-        # 1% chance of charging (solar panel kick-in)
-        if random.random() < 0.01:
-            charge = random.uniform(2.0, 5.0)
-            change = charge
-        else:
-            # Normal drain
-            drain = random.uniform(0.01, 0.05)
-            change = -drain
-            
-        self.current_values["battery_level"] = max(0.0, min(100.0, self.current_values["battery_level"] + change))
-        return round(self.current_values["battery_level"], 1)
-
-    def simulate_signal(self) -> float:
-        """
-        Simulate Signal Strength (dBm):
-        - Fluctuate around a mean
-        - Occasional drops
-        """
-        base_signal = -55.0
-        fluctuation = random.uniform(-5.0, 5.0)
+        # Signal fluctuates around a fixed base rather than accumulating
+        state[SIGNAL] = SIGNAL_BASE
+        np.clip(state + change, CHANNEL_MIN, CHANNEL_MAX, out=state)
         
-        # Occasional deep drop (interference)
-        if random.random() < 0.05:
-            fluctuation -= random.uniform(10.0, 20.0)
-            
-        self.current_values["signal_strength"] = base_signal + fluctuation
-        return round(self.current_values["signal_strength"], 0)
+        # Gradually update value trends to simulate environmental changes
+        np.clip(self.trends + trend_step, -TREND_LIMIT, TREND_LIMIT, out=self.trends)
+        
+        return state
     
     def generate_reading(self) -> Dict[str, Any]:
         """Generate a complete sensor reading"""
         self.readings_count += 1
         
-        npk = self.simulate_npk()
+        # One clock read per reading, shared by the simulation and the timestamp
+        now = datetime.now()
+        values = self.tick(now).tolist()
         
         return {
-            "soil_moisture": self.simulate_soil_moisture(),
-            "temperature": self.simulate_temperature(),
-            "humidity": self.simulate_humidity(),
-            "nitrogen": npk["nitrogen"],
-            "phosphorus": npk["phosphorus"],
-            "potassium": npk["potassium"],
-            "ph": self.simulate_ph(),
-            "ec": self.simulate_ec(),
-            "battery_level": self.simulate_battery(),
-            "signal_strength": self.simulate_signal(),
-            "timestamp": datetime.now().isoformat()
+            "soil_moisture": round(values[MOISTURE], 1),
+            "temperature": round(values[TEMPERATURE], 1),
+            "humidity": round(values[HUMIDITY], 1),
+            "nitrogen": round(values[NITROGEN], 1),
+            "phosphorus": round(values[PHOSPHORUS], 1),
+            "potassium": round(values[POTASSIUM], 1),
+            "ph": round(values[PH], 2),
+            "ec": round(values[EC], 2),
+            "battery_level": round(values[BATTERY], 1),
+            "signal_strength": round(values[SIGNAL], 0),
+            "timestamp": now.isoformat()
         }
 
 # ============================================================================
@@ -354,8 +313,60 @@ class PlantSensorSimulator:
 # ============================================================================
 
 def clear_console():
-    """Clear the console screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the console screen (ANSI escape, no subprocess spawn)"""
+    sys.stdout.write("\x1b[H\x1b[2J")
+
+# Lines of the frame currently on screen and the terminal size they were drawn
+# at, used to redraw only what changed
+_screen_lines: List[str] = []
+_screen_size: Optional[os.terminal_size] = None
+
+def _display_width(line: str) -> int:
+    """Terminal cells a line occupies (emoji and wide glyphs take two)"""
+    width = 0
+    for ch in line:
+        if ch == "\ufe0f":
+            width += 1  # Emoji presentation widens the preceding symbol to two cells
+        elif ch == "\u200d" or unicodedata.combining(ch):
+            continue
+        elif unicodedata.east_asian_width(ch) in ("W", "F") or ord(ch) >= 0x1F000:
+            width += 2
+        else:
+            width += 1
+    return width
+
+def write_frame(lines: List[str]):
+    """
+    Draw a full-screen frame in a single write. The first frame clears the
+    screen; later frames move the cursor to each changed row and overwrite it
+    (clearing to end of line), leaving unchanged rows untouched.
+    
+    Row addressing only works while the whole frame (plus the parked cursor
+    line) fits on screen without wrapping; if it is taller or wider than the
+    terminal, or the terminal was resized, every frame is a full
+    clear-and-redraw instead.
+    """
+    global _screen_lines, _screen_size
+    
+    size = shutil.get_terminal_size()
+    fits = len(lines) < size.lines and max(map(_display_width, lines), default=0) <= size.columns
+    
+    if not fits or size != _screen_size or len(lines) != len(_screen_lines):
+        clear_console()
+        out = ["\n".join(lines), "\n"]
+    else:
+        out = [
+            f"\x1b[{row};1H{line}\x1b[K"
+            for row, (line, previous) in enumerate(zip(lines, _screen_lines), start=1)
+            if line != previous
+        ]
+        # Park the cursor below the frame
+        out.append(f"\x1b[{len(lines) + 1};1H")
+    
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+    _screen_lines = lines
+    _screen_size = size
 
 def get_status_indicator(value: float, optimal_range: tuple) -> str:
     """Return a status indicator based on whether value is in optimal range"""
@@ -366,114 +377,177 @@ def get_status_indicator(value: float, optimal_range: tuple) -> str:
     else:
         return "🔺"  # Too high
 
-def display_dashboard(reading: Dict[str, Any], farm_id: str, api_status: str, readings_count: int):
-    """Display a nice console dashboard with current sensor values"""
-    
-    clear_console()
+# Static dashboard pieces, built once instead of on every frame
+RULE = "=" * 60
+DIVIDER = "-" * 60
+READINGS_SECTION = ("", DIVIDER, "📈 CURRENT SENSOR READINGS", DIVIDER, "")
+NUTRIENTS_SECTION = ("", DIVIDER, "🧪 SOIL NUTRIENTS (NPK)", DIVIDER, "")
+CHEMISTRY_SECTION = ("", DIVIDER, "🔬 SOIL CHEMISTRY", DIVIDER, "")
+DASHBOARD_FOOTER = (
+    "",
+    RULE,
+    "Legend: ✅ Optimal | 🔻 Too Low | 🔺 Too High",
+    "Press Ctrl+C to stop the sensor simulation",
+    RULE,
+)
+DASHBOARD_RANGES = SensorRanges()
+
+def build_dashboard_header(farm_id: str) -> Tuple[str, ...]:
+    """
+    Build the dashboard lines that stay the same for the whole run: the banner
+    followed by the Farm ID line (the connection status is shown between them)
+    """
+    return (
+        RULE,
+        "🌱 SMART FARMING - PLANT SENSOR SIMULATOR 🌱",
+        RULE,
+        "",
+        f"🏠 Farm ID: {farm_id if farm_id else 'Not configured'}",
+    )
+
+def display_dashboard(reading: Dict[str, Any], farm_id: str, api_status: str, readings_count: int,
+                      header: Optional[Tuple[str, ...]] = None):
+    """
+    Display a nice console dashboard with current sensor values.
+    Pass a header from build_dashboard_header() to avoid rebuilding it every call.
+    The whole frame is assembled first and only the changed lines are redrawn.
+    """
     
-    print("=" * 60)
-    print("🌱 SMART FARMING - PLANT SENSOR SIMULATOR 🌱")
-    print("=" * 60)
-    print()
+    ranges = DASHBOARD_RANGES
     
-    print(f"📡 Connection Status: {api_status}")
-    print(f"🏠 Farm ID: {farm_id if farm_id else 'Not configured'}")
-    print(f"📊 Total Readings: {readings_count}")
-    print(f"⏰ Timestamp: {reading['timestamp']}")
-    print()
-    print("-" * 60)
-    print("📈 CURRENT SENSOR READINGS")
-    print("-" * 60)
-    print()
+    if header is None:
+        header = build_dashboard_header(farm_id)
     
-    ranges = SensorRanges()
+    lines = [
+        *header[:-1],
+        f"📡 Connection Status: {api_status}",
+        header[-1],
+        f"📊 Total Readings: {readings_count}",
+        f"⏰ Timestamp: {reading['timestamp']}",
+        *READINGS_SECTION,
+    ]
     
     # Soil Moisture
     status = get_status_indicator(reading["soil_moisture"], ranges.SOIL_MOISTURE_OPTIMAL)
     bar = create_progress_bar(reading["soil_moisture"], 0, 100, 20)
-    print(f"  💧 Soil Moisture:    {reading['soil_moisture']:>6.1f}%   {bar} {status}")
+    lines.append(f"  💧 Soil Moisture:    {reading['soil_moisture']:>6.1f}%   {bar} {status}")
     
     # Temperature
     status = get_status_indicator(reading["temperature"], ranges.TEMP_OPTIMAL)
     bar = create_progress_bar(reading["temperature"], 10, 45, 20)
-    print(f"  🌡️  Temperature:      {reading['temperature']:>6.1f}°C  {bar} {status}")
+    lines.append(f"  🌡️  Temperature:      {reading['temperature']:>6.1f}°C  {bar} {status}")
     
     # Humidity
     status = get_status_indicator(reading["humidity"], ranges.HUMIDITY_OPTIMAL)
     bar = create_progress_bar(reading["humidity"], 0, 100, 20)
-    print(f"  💨 Humidity:         {reading['humidity']:>6.1f}%   {bar} {status}")
+    lines.append(f"  💨 Humidity:         {reading['humidity']:>6.1f}%   {bar} {status}")
     
-    print()
-    print("-" * 60)
-    print("🧪 SOIL NUTRIENTS (NPK)")
-    print("-" * 60)
-    print()
+    lines += NUTRIENTS_SECTION
     
     # NPK Values
     status = get_status_indicator(reading["nitrogen"], ranges.NITROGEN_OPTIMAL)
     bar = create_progress_bar(reading["nitrogen"], 80, 220, 20)
-    print(f"  🔵 Nitrogen (N):     {reading['nitrogen']:>6.1f} mg/kg  {bar} {status}")
+    lines.append(f"  🔵 Nitrogen (N):     {reading['nitrogen']:>6.1f} mg/kg  {bar} {status}")
     
     status = get_status_indicator(reading["phosphorus"], ranges.PHOSPHORUS_OPTIMAL)
     bar = create_progress_bar(reading["phosphorus"], 10, 70, 20)
-    print(f"  🟡 Phosphorus (P):   {reading['phosphorus']:>6.1f} mg/kg  {bar} {status}")
+    lines.append(f"  🟡 Phosphorus (P):   {reading['phosphorus']:>6.1f} mg/kg  {bar} {status}")
     
     status = get_status_indicator(reading["potassium"], ranges.POTASSIUM_OPTIMAL)
     bar = create_progress_bar(reading["potassium"], 50, 130, 20)
-    print(f"  🟠 Potassium (K):    {reading['potassium']:>6.1f} mg/kg  {bar} {status}")
+    lines.append(f"  🟠 Potassium (K):    {reading['potassium']:>6.1f} mg/kg  {bar} {status}")
     
-    print()
-    print("-" * 60)
-    print("🔬 SOIL CHEMISTRY")
-    print("-" * 60)
-    print()
+    lines += CHEMISTRY_SECTION
     
     # pH
     status = get_status_indicator(reading["ph"], ranges.PH_OPTIMAL)
     bar = create_progress_bar(reading["ph"], 4, 9, 20)
-    print(f"  ⚗️  pH Level:         {reading['ph']:>6.2f}      {bar} {status}")
+    lines.append(f"  ⚗️  pH Level:         {reading['ph']:>6.2f}      {bar} {status}")
     
     # EC
     status = get_status_indicator(reading["ec"], ranges.EC_OPTIMAL)
     bar = create_progress_bar(reading["ec"], 0, 3, 20)
-    print(f"  ⚡ EC (Conductivity): {reading['ec']:>6.2f} mS/cm {bar} {status}")
+    lines.append(f"  ⚡ EC (Conductivity): {reading['ec']:>6.2f} mS/cm {bar} {status}")
     
-    print()
-    print("=" * 60)
-    print("Legend: ✅ Optimal | 🔻 Too Low | 🔺 Too High")
-    print("Press Ctrl+C to stop the sensor simulation")
-    print("=" * 60)
+    lines += DASHBOARD_FOOTER
+    
+    write_frame(lines)
+
+def display_status_line(reading: Dict[str, Any], api_status: str, readings_count: int):
+    """Print a single-line summary when stdout is not an interactive terminal"""
+    print(
+        f"[{reading['timestamp']}] #{readings_count} {api_status} | "
+        f"moisture={reading['soil_moisture']:.1f}% temp={reading['temperature']:.1f}°C "
+        f"humidity={reading['humidity']:.1f}% N={reading['nitrogen']:.1f} "
+        f"P={reading['phosphorus']:.1f} K={reading['potassium']:.1f} "
+        f"pH={reading['ph']:.2f} EC={reading['ec']:.2f}"
+    )
+
+def _render_progress_bar(filled: int, width: int) -> str:
+    """Render a bar with `filled` cells out of `width`"""
+    return f"[{'█' * filled}{'░' * (width - filled)}]"
 
-def create_progress_bar(value: float, min_val: float, max_val: float, width: int = 20) -> str:
+# Every possible bar at the default width, indexed by the number of filled cells
+PROGRESS_BAR_WIDTH = 20
+_BARS = tuple(_render_progress_bar(i, PROGRESS_BAR_WIDTH) for i in range(PROGRESS_BAR_WIDTH + 1))
+
+def create_progress_bar(value: float, min_val: float, max_val: float, width: int = PROGRESS_BAR_WIDTH) -> str:
     """Create a visual progress bar"""
     normalized = (value - min_val) / (max_val - min_val)
     normalized = max(0, min(1, normalized))
     filled = int(normalized * width)
-    empty = width - filled
-    return f"[{'█' * filled}{'░' * empty}]"
+    if width == PROGRESS_BAR_WIDTH:
+        return _BARS[filled]
+    return _render_progress_bar(filled, width)
 
 # ============================================================================
 # API COMMUNICATION
 # ============================================================================
 
+# Shared HTTP session so every reading reuses the same keep-alive connection
+# instead of opening a new TCP/TLS connection per POST
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize an API payload to JSON bytes (orjson when installed)"""
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
 def send_sensor_data(reading: Dict[str, Any], farm_id: str) -> tuple[bool, str]:
     """
-    Send sensor data to the Smart-Farming API
+    Send a single sensor reading to the Smart-Farming API
+    Returns: (success: bool, message: str)
+    """
+    return send_sensor_batch([reading], farm_id)
+
+def send_sensor_batch(readings: List[Dict[str, Any]], farm_id: str) -> tuple[bool, str]:
+    """
+    Send one or more sensor readings to the Smart-Farming API in a single POST.
+    Multiple readings go out as {"farm_id": ..., "readings": [...]}.
     Returns: (success: bool, message: str)
     """
     if not farm_id:
         return False, "❌ No Farm ID configured"
     
     try:
-        payload = {
-            "farm_id": farm_id,
-            **reading
-        }
+        if len(readings) == 1:
+            payload = {
+                "farm_id": farm_id,
+                **readings[0]
+            }
+        else:
+            payload = {
+                "farm_id": farm_id,
+                "readings": readings
+            }
         
-        response = requests.post(
+        response = SESSION.post(
             API_ENDPOINT,
-            json=payload,
-            headers={"Content-Type": "application/json"},
+            data=encode_payload(payload),
             timeout=10
         )
         
@@ -489,6 +563,57 @@ def send_sensor_data(reading: Dict[str, Any], farm_id: str) -> tuple[bool, str]:
     except Exception as e:
         return False, f"❌ Error: {str(e)}"
 
+class SensorUploader:
+    """
+    Posts readings from a background thread so a slow API round trip never
+    delays the next reading. Readings that pile up while a request is in
+    flight are sent together, split into requests of at most chunk_size
+    readings so a backlog never exceeds the API's body size limit.
+    """
+    
+    def __init__(self, farm_id: str, batch_size: int = BATCH_SIZE):
+        self.farm_id = farm_id
+        self.batch_size = min(MAX_BATCH_READINGS, max(1, batch_size))
+        self.chunk_size = min(MAX_BATCH_READINGS, max(self.batch_size, 50))
+        self.status = "🔄 Initializing..."
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="sensor-uploader", daemon=True)
+        self._thread.start()
+    
+    def submit(self, reading: Dict[str, Any]):
+        """Queue a reading for upload (never blocks)"""
+        self._queue.put(reading)
+    
+    def close(self, timeout: float = 10):
+        """Flush any buffered readings and stop the upload thread"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+    
+    def _run(self):
+        pending: List[Dict[str, Any]] = []
+        stopping = False
+        
+        while not stopping:
+            # Block for the next reading, then take everything else already queued
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                pending.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            # A failed request only loses its own chunk, not the whole backlog
+            while pending and (stopping or len(pending) >= self.batch_size):
+                chunk, pending = pending[:self.chunk_size], pending[self.chunk_size:]
+                _, self.status = send_sensor_batch(chunk, self.farm_id)
+            
+            if pending:
+                self.status = f"📦 Buffered {len(pending)}/{self.batch_size} readings"
+
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
@@ -498,9 +623,9 @@ def get_farm_id() -> str:
     farm_id = DEFAULT_FARM_ID
     
     if not farm_id:
-        print("=" * 60)
+        print(RULE)
         print("🌱 SMART FARMING - PLANT SENSOR SIMULATOR 🌱")
-        print("=" * 60)
+        print(RULE)
         print()
         print("To connect your sensor to a specific farm,")
         print("enter your Farm ID below (UUID format).")
@@ -520,7 +645,7 @@ def main():
     farm_id = get_farm_id()
     
     # Initialize sensor simulator
-    simulator = PlantSensorSimulator()
+    simulator = PlantSensorSimulator(int(SIMULATOR_SEED) if SIMULATOR_SEED else None)
     
     print("🚀 Starting sensor simulation...")
     print(f"📡 API Endpoint: {API_ENDPOINT}")
@@ -530,34 +655,64 @@ def main():
     
     api_status = "🔄 Initializing..."
     
+    # Only redraw the full-screen dashboard on an interactive terminal
+    is_tty = sys.stdout.isatty()
+    if is_tty and os.name == 'nt':
+        os.system('')  # Enable ANSI escape processing on Windows consoles
+    header = build_dashboard_header(farm_id)
+    
+    # Absolute deadline for the next reading, so time spent posting and
+    # rendering does not stretch the interval between readings
+    next_tick = time.monotonic()
+    
+    # Uploads run in the background so API latency never delays a reading
+    uploader = SensorUploader(farm_id) if farm_id else None
+    
     try:
         while True:
             # Generate sensor reading
             reading = simulator.generate_reading()
             
             # Send to API if farm_id is configured
-            if farm_id:
-                success, api_status = send_sensor_data(reading, farm_id)
+            if uploader:
+                uploader.submit(reading)
+                api_status = uploader.status
             else:
                 api_status = "⚪ Standalone Mode (no API)"
             
             # Display dashboard
-            display_dashboard(
-                reading, 
-                farm_id, 
-                api_status, 
-                simulator.readings_count
-            )
+            if QUIET:
+                if simulator.readings_count % LOG_EVERY == 0:
+                    display_status_line(reading, api_status, simulator.readings_count)
+            elif simulator.readings_count % DISPLAY_EVERY == 0:
+                if is_tty:
+                    display_dashboard(
+                        reading, 
+                        farm_id, 
+                        api_status, 
+                        simulator.readings_count,
+                        header
+                    )
+                else:
+                    display_status_line(reading, api_status, simulator.readings_count)
             
             # Wait for next reading
-            time.sleep(UPDATE_INTERVAL)
+            next_tick += UPDATE_INTERVAL
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Overloaded: skip the missed ticks instead of bursting to catch up
+                next_tick = time.monotonic()
             
     except KeyboardInterrupt:
+        if uploader:
+            uploader.close()
         print("\n")
-        print("=" * 60)
+        print(RULE)
         print("🛑 Sensor simulation stopped")
         print(f"📊 Total readings generated: {simulator.readings_count}")
-        print("=" * 60)
+        print(RULE)
         sys.exit(0)
 
 if __name__ == "__main__":
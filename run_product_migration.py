@@ -26,12 +26,18 @@ async def run_migration():
     print(f"   Database: {DB_NAME}")
     
     try:
-        conn = await asyncpg.connect(
+        # A small pool lets the verification queries below run concurrently.
+        # The statement cache is off because the Supabase pooler (port 6543)
+        # runs in transaction mode and cannot keep prepared statements.
+        pool = await asyncpg.create_pool(
             host=DB_HOST,
             port=DB_PORT,
             user=DB_USER,
             password=DB_PASSWORD,
-            database=DB_NAME
+            database=DB_NAME,
+            min_size=1,
+            max_size=3,
+            statement_cache_size=0
         )
         
         print("✅ Connected successfully!")
@@ -46,33 +52,39 @@ async def run_migration():
         print(f"   File size: {len(sql_content)} characters")
         
         # Execute migration
+        # The whole script goes in one simple-query round trip (splitting it would
+        # cost one per statement and break the dollar-quoted function bodies).
+        # Running it in a transaction commits once and rolls back cleanly on error.
         print("\n🚀 Executing migration...")
-        await conn.execute(sql_content)
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(sql_content)
         
         print("✅ Migration executed successfully!")
         
         # Verify tables created
+        # The table check and both counts are independent, so they run concurrently on pooled connections
         print("\n🔍 Verifying tables...")
-        tables = await conn.fetch("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name IN ('fertilizer_products', 'recommendation_reports', 'agricultural_dealers')
-            ORDER BY table_name
-        """)
+        tables, product_count, dealer_count = await asyncio.gather(
+            pool.fetch("""
+                SELECT table_name 
+                FROM information_schema.tables 
+                WHERE table_schema = 'public' 
+                AND table_name IN ('fertilizer_products', 'recommendation_reports', 'agricultural_dealers')
+                ORDER BY table_name
+            """),
+            pool.fetchval("SELECT COUNT(*) FROM fertilizer_products"),
+            pool.fetchval("SELECT COUNT(*) FROM agricultural_dealers")
+        )
         
         for row in tables:
             print(f"   ✓ Table '{row['table_name']}' exists")
         
-        # Count products
-        product_count = await conn.fetchval("SELECT COUNT(*) FROM fertilizer_products")
-        dealer_count = await conn.fetchval("SELECT COUNT(*) FROM agricultural_dealers")
-        
         print(f"\n📊 Data Summary:")
         print(f"   • Fertilizer Products: {product_count}")
         print(f"   • Agricultural Dealers: {dealer_count}")
         
-        await conn.close()
+        await pool.close()
         print("\n🎉 Migration completed successfully!")
         return True
         
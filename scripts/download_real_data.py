@@ -1,18 +1,21 @@
 import requests
 import os
+import shutil
 
 url = "https://raw.githubusercontent.com/Gladiator07/Harvestify/master/Data-processed/crop_recommendation.csv"
 target_path = os.path.join("datasets", "Real_Soil_Data.csv")
 
 try:
     print(f"Downloading from {url}...")
-    response = requests.get(url)
-    response.raise_for_status()
+    # Stream the body straight to disk in 1 MB chunks instead of holding it in memory
+    with requests.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # Undo any gzip transfer encoding
+        
+        with open(target_path, "wb") as f:
+            shutil.copyfileobj(response.raw, f, length=1 << 20)
     
-    with open(target_path, "w", encoding='utf-8') as f:
-        f.write(response.text)
-    
-    print(f"✅ Downloaded {len(response.text)} bytes to {target_path}")
+    print(f"✅ Downloaded {os.path.getsize(target_path)} bytes to {target_path}")
     
 except Exception as e:
     print(f"❌ Error: {e}")
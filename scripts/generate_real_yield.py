@@ -4,11 +4,15 @@ import os
 
 # Load Real Soil Data
 input_path = os.path.join("datasets", "Real_Soil_Data.csv")
-output_path = os.path.join("datasets", "Final_Real_Yield_Data.csv")
+# The yield model reads the CSV; set YIELD_OUTPUT_PATH to a .parquet file for a
+# smaller, faster columnar copy (needs pyarrow)
+output_path = os.environ.get("YIELD_OUTPUT_PATH", os.path.join("datasets", "Final_Real_Yield_Data.csv"))
 
 try:
     print(f"Reading {input_path}...")
     df = pd.read_csv(input_path)
+    # Only a couple of dozen distinct crops: keep labels as small integer codes
+    df['label'] = df['label'].astype('category')
     
     # Define Base Yields (kg/ha) & Optimal Conditions (India Averages)
     # Source: Indian Council of Agricultural Research (ICAR) benchmarks
@@ -37,46 +41,45 @@ try:
         'coffee': {'base': 1200, 'opt_ph': 6.0, 'opt_temp': 20, 'days': 270},
     }
 
-    def calculate_yield(row):
-        crop = row['label']
-        profile = crop_profiles.get(crop.lower())
-        
-        if not profile:
-            return 2000 # Default fallback
-            
-        base_yield = profile['base']
-        
-        # pH Penalty (10% loss per 1.0 pH deviation)
-        ph_diff = abs(row['ph'] - profile['opt_ph'])
-        ph_factor = max(0.5, 1.0 - (ph_diff * 0.1))
-        
-        # Temp Penalty (5% loss per 1°C deviation > 5°C)
-        temp_diff = abs(row['temperature'] - profile['opt_temp'])
-        temp_penalty = 0
-        if temp_diff > 5:
-            temp_penalty = (temp_diff - 5) * 0.05
-        temp_factor = max(0.4, 1.0 - temp_penalty)
-        
-        # NPK Bonus (Simple approximation: Higher nutrients = better yield up to a limit)
-        # NPK in dataset is 0-140 range roughly.
-        npk_score = (row['N'] + row['P'] + row['K']) / 200.0 
-        npk_factor = 0.8 + (npk_score * 0.4) # Range 0.8 to 1.2
-        
-        # Scientific Yield Calculation
-        final_yield = base_yield * ph_factor * temp_factor * npk_factor
-        
-        # Add random biological variance (+/- 10%)
-        variance = np.random.uniform(0.9, 1.1)
-        
-        return round(final_yield * variance, 2)
-
-    def get_days(row):
-        profile = crop_profiles.get(row['label'].lower())
-        return profile['days'] if profile else 120
+    # Per-crop lookup arrays, indexed by each crop's position in crop_profiles
+    crop_to_idx = {crop: i for i, crop in enumerate(crop_profiles)}
+    base_arr = np.array([p['base'] for p in crop_profiles.values()], dtype=float)
+    ph_opt_arr = np.array([p['opt_ph'] for p in crop_profiles.values()], dtype=float)
+    temp_opt_arr = np.array([p['opt_temp'] for p in crop_profiles.values()], dtype=float)
+    days_arr = np.array([p['days'] for p in crop_profiles.values()])
 
     print("Calculating yields based on agronomic logic...")
-    df['yield_kg_per_hectare'] = df.apply(calculate_yield, axis=1)
-    df['total_days'] = df.apply(get_days, axis=1)
+    # Map each distinct crop to its profile index once, then gather per row through
+    # the category codes; the formula below then runs on whole columns.
+    # A trailing NaN catches code -1 (missing label) as "no profile".
+    category_idx = df['label'].cat.categories.str.lower().map(crop_to_idx).to_numpy(dtype=float)
+    row_idx = np.append(category_idx, np.nan)[df['label'].cat.codes.to_numpy()]
+    known = ~np.isnan(row_idx)  # Rows without a profile get the fallback values
+    codes = np.where(known, row_idx, 0).astype(int)
+    
+    # pH Penalty (10% loss per 1.0 pH deviation)
+    ph_diff = np.abs(df['ph'].to_numpy() - ph_opt_arr[codes])
+    ph_factor = np.maximum(0.5, 1.0 - (ph_diff * 0.1))
+    
+    # Temp Penalty (5% loss per 1°C deviation > 5°C)
+    temp_diff = np.abs(df['temperature'].to_numpy() - temp_opt_arr[codes])
+    temp_penalty = np.maximum(0, temp_diff - 5) * 0.05
+    temp_factor = np.maximum(0.4, 1.0 - temp_penalty)
+    
+    # NPK Bonus (Simple approximation: Higher nutrients = better yield up to a limit)
+    # NPK in dataset is 0-140 range roughly.
+    npk_score = (df['N'] + df['P'] + df['K']).to_numpy() / 200.0
+    npk_factor = 0.8 + (npk_score * 0.4) # Range 0.8 to 1.2
+    
+    # Scientific Yield Calculation
+    final_yield = base_arr[codes] * ph_factor * temp_factor * npk_factor
+    
+    # Add random biological variance (+/- 10%), seeded so reruns reproduce the dataset
+    rng = np.random.default_rng(int(os.environ.get("YIELD_SEED", "42")))
+    variance = rng.uniform(0.9, 1.1, size=len(df))
+    
+    df['yield_kg_per_hectare'] = np.where(known, np.round(final_yield * variance, 2), 2000) # 2000 = default fallback
+    df['total_days'] = np.where(known, days_arr[codes], 120)
     
     # Rename columns to match our ML model expectations if needed
     # Model expects: soil_moisture_%, soil_pH, temperature_C, rainfall_mm, humidity_%
@@ -92,8 +95,12 @@ try:
     # Crop Recommendation dataset lacks 'soil_moisture'.
     # We can infer moisture roughly from Rainfall + Humidity
     # High rain + high humidity = High soil moisture
-    df['soil_moisture_%'] = (df['rainfall_mm'] / 10) + (df['humidity_%'] * 0.4)
-    df['soil_moisture_%'] = df['soil_moisture_%'].clip(10, 90).round(2)
+    # Computed in place in one float32 buffer (values stay within 10..90)
+    soil_moisture = np.multiply(df['humidity_%'].to_numpy(), 0.4, dtype=np.float32)
+    soil_moisture += df['rainfall_mm'].to_numpy(dtype=np.float32) / 10
+    np.clip(soil_moisture, 10, 90, out=soil_moisture)
+    np.round(soil_moisture, 2, out=soil_moisture)
+    df['soil_moisture_%'] = soil_moisture
     
     df['sunlight_hours'] = 7.5 # Average
     df['irrigation_type'] = 'Rainfed' # Default
@@ -102,8 +109,15 @@ try:
     df['NDVI_index'] = 0.65 # Average vegetation index
     df['crop_disease_status'] = 'None' # Healthy by default
     
+    # Constant text columns as categoricals (dictionary-encoded in Parquet)
+    for col in ('irrigation_type', 'fertilizer_type', 'crop_disease_status'):
+        df[col] = df[col].astype('category')
+    
     print(f"Saving augmented real data to {output_path}...")
-    df.to_csv(output_path, index=False)
+    if output_path.endswith(".parquet"):
+        df.to_parquet(output_path, index=False, compression="zstd")
+    else:
+        df.to_csv(output_path, index=False)
     print("✅ Success! Created scientifically valid yield dataset.")
 
 except Exception as e:
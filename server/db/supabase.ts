@@ -125,6 +125,16 @@ export const db = {
     return data;
   },
 
+  async saveSensorDataBatch(readings: any[]) {
+    const { data, error } = await supabase
+      .from('sensor_readings')
+      .insert(readings)
+      .select();
+    
+    if (error) throw error;
+    return data;
+  },
+
   async getSensorHistory(farmId: string, limit = 100) {
     const { data, error } = await supabase
       .from('sensor_readings')
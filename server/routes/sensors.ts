@@ -63,6 +63,7 @@ export const getLatestSensorData = async (req: Request, res: Response) => {
 };
 
 // POST /api/sensors - Save new sensor reading
+// Also accepts a batch: { farm_id, readings: [...] } inserted in one request
 export const saveSensorData = async (req: Request, res: Response) => {
   try {
     const sensorData = req.body;
@@ -72,6 +73,18 @@ export const saveSensorData = async (req: Request, res: Response) => {
       return res.status(400).json({ error: 'farm_id is required' });
     }
 
+    if (Array.isArray(sensorData.readings)) {
+      const now = new Date().toISOString();
+      const rows = sensorData.readings.map((reading: any) => ({
+        ...reading,
+        farm_id: sensorData.farm_id,
+        timestamp: reading.timestamp || now,
+      }));
+
+      const saved = await db.saveSensorDataBatch(rows);
+      return res.status(201).json({ sensorData: saved });
+    }
+
     // Add timestamp if not provided
     if (!sensorData.timestamp) {
       sensorData.timestamp = new Date().toISOString();
@@ -1,56 +1,43 @@
-import requests
+import asyncio
+import aiohttp
 import json
 import time
 
 BASE_URL = "http://localhost:8000/api/spacing"
 
-def print_result(name, response):
-    if response.status_code == 200:
+def print_result(name, status, text):
+    if status == 200:
         print(f"✅ {name}: SUCCESS")
-        # print(json.dumps(response.json(), indent=2))
+        # print(json.dumps(json.loads(text), indent=2))
     else:
-        print(f"❌ {name}: FAILED ({response.status_code})")
-        print(response.text)
+        print(f"❌ {name}: FAILED ({status})")
+        print(text)
 
-def test_api():
+async def call(session, method, path, payload=None):
+    """Send one request and return (status, body text)"""
+    async with session.request(method, f"{BASE_URL}{path}", json=payload) as res:
+        return res.status, await res.text()
+
+async def run_checks():
     print("🚀 Starting Row Spacing API Verification...")
     
-    # 1. Test Get Supported Crops
-    try:
-        res = requests.get(f"{BASE_URL}/crops")
-        print_result("Get Supported Crops", res)
-    except Exception as e:
-        print(f"❌ Get Crops Connection Error: {e}")
-
-    # 2. Test Optimization (Wheat)
+    # Payload for 2. Optimization (Wheat)
     payload_optimize = {
         "crop_type": "Wheat",
         "farm_size_hectares": 2.5,
         "soil_fertility_level": "medium",
         "farm_equipment": "manual"
     }
-    try:
-        res = requests.post(f"{BASE_URL}/optimize", json=payload_optimize)
-        print_result("Optimize Spacing (Wheat)", res)
-    except Exception as e:
-        print(f"❌ Optimize Connection Error: {e}")
 
-    # 3. Test Yield Prediction
+    # Payload for 3. Yield Prediction
     payload_predict = {
         "crop_type": "Rice",
         "row_spacing_cm": 20,
         "soil_data": {"N": 80, "P": 40, "K": 40},
         "weather_data": {"rainfall": 1000}
     }
-    try:
-        res = requests.post(f"{BASE_URL}/predict-yield", json=payload_predict)
-        print_result("Predict Yield (Rice 20cm)", res)
-        if res.status_code == 200:
-            print(f"   Yield: {res.json()['predicted_yield_kg_ha']} kg/ha")
-    except Exception as e:
-        print(f"❌ Predict Connection Error: {e}")
 
-    # 4. Test Compare Spacing
+    # Payload for 4. Compare Spacing
     payload_compare = {
         "crop_type": "Wheat",
         "current_spacing_cm": 25,
@@ -58,17 +45,8 @@ def test_api():
         "soil_data": {"N": 80, "P": 40, "K": 40},
         "weather_data": {"rainfall": 800}
     }
-    try:
-        res = requests.post(f"{BASE_URL}/compare", json=payload_compare)
-        print_result("Compare Spacing (Wheat 25cm vs Optimal)", res)
-        if res.status_code == 200:
-            data = res.json()
-            print(f"   Improvement: {data['improvement_percent']}%")
-            print(f"   Extra Income: {data['financial_impact']['total_income_increase']}")
-    except Exception as e:
-        print(f"❌ Compare Connection Error: {e}")
 
-    # 5. Test Planting Guide
+    # Payload for 5. Planting Guide
     payload_guide = {
         "crop_type": "Wheat",
         "farm_size_hectares": 2.5,
@@ -76,11 +54,51 @@ def test_api():
         "plant_spacing_cm": 5,
         "farm_equipment": "manual"
     }
-    try:
-        res = requests.post(f"{BASE_URL}/planting-guide", json=payload_guide)
-        print_result("Generate Planting Guide", res)
-    except Exception as e:
-        print(f"❌ Guide Connection Error: {e}")
+
+    # (result name, error label, method, path, payload)
+    checks = [
+        # 1. Test Get Supported Crops
+        ("Get Supported Crops", "Get Crops", "GET", "/crops", None),
+        # 2. Test Optimization (Wheat)
+        ("Optimize Spacing (Wheat)", "Optimize", "POST", "/optimize", payload_optimize),
+        # 3. Test Yield Prediction
+        ("Predict Yield (Rice 20cm)", "Predict", "POST", "/predict-yield", payload_predict),
+        # 4. Test Compare Spacing
+        ("Compare Spacing (Wheat 25cm vs Optimal)", "Compare", "POST", "/compare", payload_compare),
+        # 5. Test Planting Guide
+        ("Generate Planting Guide", "Guide", "POST", "/planting-guide", payload_guide),
+    ]
+
+    # The checks are independent, so send them all at once over one pooled session
+    # and report in the original order once every response is in
+    start = time.perf_counter()
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=8)) as session:
+        results = await asyncio.gather(
+            *(call(session, method, path, payload) for _, _, method, path, payload in checks),
+            return_exceptions=True
+        )
+
+    for (name, label, *_), result in zip(checks, results):
+        if isinstance(result, Exception):
+            print(f"❌ {label} Connection Error: {result}")
+            continue
+
+        status, text = result
+        print_result(name, status, text)
+        if status != 200:
+            continue
+
+        try:
+            if label == "Predict":
+                print(f"   Yield: {json.loads(text)['predicted_yield_kg_ha']} kg/ha")
+            elif label == "Compare":
+                data = json.loads(text)
+                print(f"   Improvement: {data['improvement_percent']}%")
+                print(f"   Extra Income: {data['financial_impact']['total_income_increase']}")
+        except Exception as e:
+            print(f"❌ {label} Connection Error: {e}")
+
+    print(f"⏱️  Completed {len(checks)} checks in {time.perf_counter() - start:.2f}s")
 
 if __name__ == "__main__":
-    test_api()
+    asyncio.run(run_checks())
@@ -65,16 +65,13 @@ def _to_float(raw: str) -> Optional[float]:
         return None
 
 
-def percentile(values: List[float], p: float) -> float:
-    """Linear-interpolated percentile for p in [0,1]."""
-    if not values:
-        raise ValueError("percentile() requires non-empty list")
+def _sorted_percentile(xs: List[float], p: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
     if p <= 0:
-        return min(values)
+        return xs[0]
     if p >= 1:
-        return max(values)
+        return xs[-1]
 
-    xs = sorted(values)
     n = len(xs)
     # position in [0, n-1]
     pos = p * (n - 1)
@@ -86,6 +83,19 @@ def percentile(values: List[float], p: float) -> float:
     return xs[lo] * (1 - frac) + xs[hi] * frac
 
 
+def percentiles(values: List[float], ps: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Linear-interpolated percentiles for each p in [0,1], sorting only once."""
+    if not values:
+        raise ValueError("percentiles() requires non-empty list")
+    xs = sorted(values)
+    return tuple(_sorted_percentile(xs, p) for p in ps)
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Linear-interpolated percentile for p in [0,1]."""
+    return percentiles(values, (p,))[0]
+
+
 @dataclass
 class Agg:
     moisture: List[float]
@@ -100,26 +110,22 @@ def empty_agg() -> Agg:
     return Agg([], [], [], [], [], [])
 
 
-def agg_add(agg: Agg, row: Dict[str, str]) -> None:
-    m = _to_float(row.get("Soil_Moisture_%"))
-    t = _to_float(row.get("Temperature_C"))
-    ph = _to_float(row.get("pH_Level"))
-    n = _to_float(row.get("Nitrogen_N"))
-    p = _to_float(row.get("Phosphorus_P"))
-    k = _to_float(row.get("Potassium_K"))
-
-    if m is not None:
-        agg.moisture.append(m)
-    if t is not None:
-        agg.temp.append(t)
-    if ph is not None:
-        agg.ph.append(ph)
-    if n is not None:
-        agg.n.append(n)
-    if p is not None:
-        agg.p.append(p)
-    if k is not None:
-        agg.k.append(k)
+# CSV columns feeding each Agg list, in Agg field order.
+METRIC_COLUMNS = (
+    "Soil_Moisture_%",
+    "Temperature_C",
+    "pH_Level",
+    "Nitrogen_N",
+    "Phosphorus_P",
+    "Potassium_K",
+)
+
+
+def agg_add(agg: Agg, metrics: Tuple[Optional[float], ...]) -> None:
+    lists = (agg.moisture, agg.temp, agg.ph, agg.n, agg.p, agg.k)
+    for values, value in zip(lists, metrics):
+        if value is not None:
+            values.append(value)
 
 
 def build_profile(agg: Agg, low_p: float, high_p: float) -> Optional[Dict]:
@@ -139,8 +145,7 @@ def build_profile(agg: Agg, low_p: float, high_p: float) -> Optional[Dict]:
     def band(values: List[float], clamp: Optional[Tuple[float, float]] = None) -> Optional[Tuple[float, float]]:
         if len(values) < min_samples:
             return None
-        lo = percentile(values, low_p)
-        hi = percentile(values, high_p)
+        lo, hi = percentiles(values, (low_p, high_p))
         if clamp is not None:
             lo = max(clamp[0], min(clamp[1], lo))
             hi = max(clamp[0], min(clamp[1], hi))
@@ -206,26 +211,38 @@ def main() -> int:
     aggs_by_soil: Dict[str, Dict[str, Agg]] = {}
 
     with open(input_path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+        # Plain csv.reader with column indices resolved once from the header;
+        # each row is parsed once and shared by the overall and soil aggregates.
+        reader = csv.reader(f)
+        header = next(reader, [])
+        col = {name: i for i, name in enumerate(header)}
+        crop_idx = col.get("Crop_Type")
+        soil_idx = col.get("Soil_Type")
+        metric_idx = [col.get(name) for name in METRIC_COLUMNS]
+
+        def cell(row: List[str], idx: Optional[int]) -> Optional[str]:
+            return row[idx] if idx is not None and idx < len(row) else None
+
         for row in reader:
-            crop_raw = (row.get("Crop_Type") or "").strip()
+            crop_raw = (cell(row, crop_idx) or "").strip()
             if not crop_raw:
                 continue
 
             crop_key = canonical_key(crop_raw)
-            soil_raw = (row.get("Soil_Type") or "").strip()
+            soil_raw = (cell(row, soil_idx) or "").strip()
             soil_key = canonical_key(soil_raw) if soil_raw else ""
+            metrics = tuple(_to_float(cell(row, idx)) for idx in metric_idx)
 
             if crop_key not in aggs_overall:
                 aggs_overall[crop_key] = empty_agg()
-            agg_add(aggs_overall[crop_key], row)
+            agg_add(aggs_overall[crop_key], metrics)
 
             if soil_key:
                 if crop_key not in aggs_by_soil:
                     aggs_by_soil[crop_key] = {}
                 if soil_key not in aggs_by_soil[crop_key]:
                     aggs_by_soil[crop_key][soil_key] = empty_agg()
-                agg_add(aggs_by_soil[crop_key][soil_key], row)
+                agg_add(aggs_by_soil[crop_key][soil_key], metrics)
 
             # Keep a display name if we don't have one
             if crop_key not in crops:
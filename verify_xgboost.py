@@ -1,17 +1,35 @@
-import pickle
+import hashlib
+import json
 import os
+import pickle
 
 model_path = 'backend/app/ml_models/yield_model.pkl'
-with open(model_path, 'rb') as f:
-    data = pickle.load(f)
+manifest_path = 'backend/app/ml_models/yield_model.json'
+
+def load_summary():
+    """Model type and feature list, from the manifest when it matches the pickle"""
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        with open(model_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if manifest.get('sha256') == digest:
+            return manifest['model_type'], manifest['feature_columns']
+
+    # No (or stale) manifest: fall back to unpickling the whole model
+    with open(model_path, 'rb') as f:
+        data = pickle.load(f)
+    return type(data['model']).__name__, data['feature_columns']
+
+model_type, feature_columns = load_summary()
 
 print("="*60)
 print("🎯 FINAL MODEL VERIFICATION")
 print("="*60)
-print(f"\n✅ Model Type: {type(data['model']).__name__}")
-print(f"✅ Is XGBoost: {'Yes' if 'XGB' in str(type(data['model'])) else 'No'}")
+print(f"\n✅ Model Type: {model_type}")
+print(f"✅ Is XGBoost: {'Yes' if 'XGB' in model_type else 'No'}")
 print(f"✅ File Size: {os.path.getsize(model_path)/1024:.1f} KB")
-print(f"✅ Features: {len(data['feature_columns'])}")
+print(f"✅ Features: {len(feature_columns)}")
 print(f"\n{'='*60}")
 print("MODEL READY FOR PRODUCTION!")
 print("="*60)